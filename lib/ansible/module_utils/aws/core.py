@@ -38,17 +38,18 @@ The 'AnsibleAWSModule' module provides similar, but more restricted,
 interfaces to the normal Ansible module.  It also includes the
 additional methods for connecting to AWS using the standard module arguments
 
+  client = m.client('lambda') # - get a boto3 client using the standard connection arguments.
   try:
-      m.aws_connect(resource='lambda') # - get an AWS connection.
-  except Exception:
-      m.fail_json_aws(Exception, msg="trying to connect") # - take an exception and make a decent failure
+      client.list_functions()
+  except Exception as e:
+      m.fail_json_aws(e, msg="trying to list functions") # - take an exception and make a decent failure
 
 
 """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
-from ansible.module_utils.ec2 import HAS_BOTO3, camel_dict_to_snake_dict, ec2_argument_spec
+from ansible.module_utils.ec2 import HAS_BOTO3, boto3_conn, camel_dict_to_snake_dict, ec2_argument_spec, get_aws_connection_info
 import traceback
 
 # We will also export HAS_BOTO3 so end user modules can use it.
@@ -105,6 +106,22 @@ class AnsibleAWSModule(object):
     def params(self):
         return self._module.params
 
+    @property
+    def _name(self):
+        return self._module._name
+
+    def client(self, service, **extra_params):
+        """return a boto3 client for service
+
+        The region, endpoint and credentials come from the standard
+        AWS module arguments; extra_params, such as a botocore config,
+        are passed on to the client.
+        """
+        region, ec2_url, aws_connect_kwargs = get_aws_connection_info(self, boto3=True)
+        aws_connect_kwargs.update(extra_params)
+        return boto3_conn(self, conn_type='client', resource=service,
+                          region=region, endpoint=ec2_url, **aws_connect_kwargs)
+
     def exit_json(self, *args, **kwargs):
         return self._module.exit_json(*args, **kwargs)
 
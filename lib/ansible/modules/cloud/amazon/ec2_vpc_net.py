@@ -16,17 +16,22 @@ DOCUMENTATION = '''
 module: ec2_vpc_net
 short_description: Configure AWS virtual private clouds
 description:
-    - Create or terminate AWS virtual private clouds.  This module has a dependency on python-boto.
+    - Create or terminate AWS virtual private clouds.  This module has a dependency on boto3 and botocore.
 version_added: "2.0"
 author: Jonathan Davila (@defionscode)
+requirements: [ boto3, botocore ]
 options:
   name:
     description:
       - The name to give your VPC. This is used in combination with the cidr_block parameter to determine if a VPC already exists.
+      - Since version 2.5 this may be a list of up to 199 names, to manage one VPC per name with the same options in a single task.
+        The VPCs are then returned as I(vpcs) instead of I(vpc).
+      - All the names in a list share the same I(cidr_block) and region. VPCs with different CIDR blocks or in different regions need
+        a task each.
     required: yes
   cidr_block:
     description:
-      - The CIDR of the VPC
+      - The CIDR of the VPC. When I(name) is a list this is the CIDR of every VPC in it.
     required: yes
   tenancy:
     description:
@@ -90,6 +95,17 @@ EXAMPLES = '''
       this: works
     tenancy: dedicated
 
+# Make sure several VPCs sharing a CIDR block and options exist, with a single lookup
+
+- ec2_vpc_net:
+    name:
+      - staging
+      - production
+    cidr_block: 10.20.0.0/16
+    region: us-east-1
+    tags:
+      module: ec2_vpc_net
+
 '''
 
 RETURN = '''
@@ -114,7 +130,7 @@ vpc.tags:
     type: dict
     sample: {"Name": "My VPC", "env": "staging"}
 vpc.classic_link_enabled:
-    description: indicates whether ClassicLink is enabled
+    description: indicates whether ClassicLink is enabled, null if the status couldn't be described
     returned: success
     type: boolean
     sample: false
@@ -133,111 +149,402 @@ vpc.is_default:
     returned: success
     type: boolean
     sample: false
+vpcs:
+    description: One entry per name, in order, with the same keys as I(vpc), or null for a VPC that is absent
+    returned: success, when I(name) is a list
+    type: list
+    version_added: "2.5"
 '''
 
+import re
+from contextlib import contextmanager
+
 try:
-    import boto.vpc
-    from boto.exception import BotoServerError, NoAuthHandlerFound
+    import botocore
+    from botocore.config import Config
 except ImportError:
-    pass  # Taken care of by ec2.HAS_BOTO
-
-from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.ec2 import (HAS_BOTO, AnsibleAWSError, boto_exception, connect_to_aws,
-                                      ec2_argument_spec, get_aws_connection_info)
+    pass  # caught by AnsibleAWSModule
+
+from ansible.module_utils.aws.core import AnsibleAWSModule
+from ansible.module_utils.ec2 import (ansible_dict_to_boto3_filter_list, ansible_dict_to_boto3_tag_list,
+                                      boto3_tag_list_to_ansible_dict, compare_aws_tags, get_aws_connection_info)
+from ansible.module_utils.six import string_types
+from ansible.module_utils._text import to_native
+
+
+# The documented vpc return values and the describe_vpcs keys they come from
+VPC_RETURN_KEYS = (
+    ('id', 'VpcId'),
+    ('cidr_block', 'CidrBlock'),
+    ('state', 'State'),
+    ('classic_link_enabled', 'ClassicLinkEnabled'),
+    ('dhcp_options_id', 'DhcpOptionsId'),
+    ('instance_tenancy', 'InstanceTenancy'),
+    ('is_default', 'IsDefault'),
+)
+
+
+# Upper bound on the names in a single task. All of them go in one describe_vpcs
+# call, which takes at most 200 filter values, and the CIDR block takes another.
+MAX_VPC_NAMES = 199
+
+# Upper bound on the AWS calls run_calls makes at once, and on the client's connection pool
+MAX_CONCURRENT_CALLS = 10
+
+# Module options, built once at import time; AnsibleAWSModule adds the common ec2 ones
+_ARGUMENT_SPEC_EXTRAS = dict(
+    name=dict(type='raw', default=None, required=True),
+    cidr_block=dict(type='str', default=None, required=True),
+    tenancy=dict(choices=['default', 'dedicated'], default='default'),
+    dns_support=dict(type='bool', default=True),
+    dns_hostnames=dict(type='bool', default=True),
+    dhcp_opts_id=dict(type='str', default=None, required=False),
+    tags=dict(type='dict', required=False, default=None, aliases=['resource_tags']),
+    state=dict(choices=['present', 'absent'], default='present'),
+    multi_ok=dict(type='bool', default=False)
+)
+
+# boto3 clients keyed on their connection parameters. A client keeps its HTTPS
+# connections in a pool, so reusing it within the process skips the TLS setup.
+_CONNECTIONS = {}
+
+# The id of the single VPC found for a (connection key, name, cidr_block) lookup,
+# kept for the life of the process so callers invoking main() repeatedly can
+# describe known VPCs by id instead of searching on their tags. Only VPCs that
+# were found are cached, and they are always described again, so their tags and
+# DHCP options are current and a VPC that no longer matches is looked up anew.
+# The connection key is the one used for _CONNECTIONS, so ids are never shared
+# between accounts, profiles or endpoints.
+_VPC_CACHE = {}
+
+# Number of lookups _VPC_CACHE holds before it is emptied
+VPC_CACHE_SIZE = 256
+
+# (connection key, name, cidr_block) of the VPCs this process has deleted, so
+# making sure they are absent again doesn't need a lookup. It is only trusted
+# for state=absent; state=present always looks the VPCs up and then forgets them.
+_DELETED_VPCS = set()
+
+
+@contextmanager
+def aws_errors(module, msg):
+    """Fails the module with msg if the wrapped AWS calls raise a botocore error"""
+    try:
+        yield
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        module.fail_json_aws(e, msg=msg)
 
 
-def vpc_exists(module, vpc, name, cidr_block, multi):
-    """Returns None or a vpc object depending on the existence of a VPC. When supplied
-    with a CIDR, it will check for matching tags to determine if it is a match
-    otherwise it will assume the VPC does not exist and thus return None.
+def _filter_value_regex(value):
+    """Returns a regex matching what an EC2 filter value matches: * and ? are
+    wildcards, and a backslash makes the next character literal.
     """
-    matched_vpc = None
-
-    try:
-        matching_vpcs = vpc.get_all_vpcs(filters={'tag:Name': name, 'cidr-block': cidr_block})
-    except Exception as e:
-        e_msg = boto_exception(e)
-        module.fail_json(msg=e_msg)
+    pattern = []
+    escaped = False
+    for char in value:
+        if escaped:
+            pattern.append(re.escape(char))
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '*':
+            pattern.append('.*')
+        elif char == '?':
+            pattern.append('.')
+        else:
+            pattern.append(re.escape(char))
+    if escaped:
+        pattern.append(re.escape('\\'))
+    return re.compile(''.join(pattern) + r'\Z', re.DOTALL)
+
+
+def _describe_vpcs_cached(module, connection, conn_key, names, cidr_block):
+    """Returns a dict of each name to the VPCs with that Name tag and CIDR block. The
+    cached VPCs are described again by id in a single call, and the names that
+    aren't cached or whose VPC no longer matches are then looked up in a single
+    describe_vpcs call. Each VPC is filed under every name that matches its Name
+    tag the way the tag:Name filter did, wildcards included.
+    """
+    name_filters = dict((name, _filter_value_regex(name)) for name in names)
+
+    def matches(name, vpc):
+        vpc_name = boto3_tag_list_to_ansible_dict(vpc.get('Tags', [])).get('Name', '')
+        return name_filters[name].match(vpc_name) is not None
+
+    matched = dict()
+
+    cached = [name for name in names if (conn_key, name, cidr_block) in _VPC_CACHE]
+    if cached:
+        vpc_ids = sorted(set(_VPC_CACHE[(conn_key, name, cidr_block)] for name in cached))
+        with aws_errors(module, "Failed to describe VPCs {0}".format(', '.join(vpc_ids))):
+            # a filter rather than VpcIds, so a VPC deleted since isn't an error
+            vpcs = connection.describe_vpcs(Filters=ansible_dict_to_boto3_filter_list({'vpc-id': vpc_ids}))['Vpcs']
+        vpcs_by_id = dict((vpc['VpcId'], vpc) for vpc in vpcs)
+        for name in cached:
+            vpc = vpcs_by_id.get(_VPC_CACHE[(conn_key, name, cidr_block)])
+            if vpc is not None and vpc.get('CidrBlock') == cidr_block and matches(name, vpc):
+                matched[name] = [vpc]
+            else:
+                del _VPC_CACHE[(conn_key, name, cidr_block)]
+
+    uncached = [name for name in names if name not in matched]
+    if uncached:
+        with aws_errors(module, "Failed to describe VPCs"):
+            vpcs = connection.describe_vpcs(Filters=ansible_dict_to_boto3_filter_list({'tag:Name': uncached, 'cidr-block': cidr_block}))['Vpcs']
+        for name in uncached:
+            matched[name] = [vpc for vpc in vpcs if matches(name, vpc)]
+            if len(matched[name]) == 1:
+                if len(_VPC_CACHE) >= VPC_CACHE_SIZE:
+                    _VPC_CACHE.clear()
+                _VPC_CACHE[(conn_key, name, cidr_block)] = matched[name][0]['VpcId']
+
+    return matched
+
+
+def connection_key(region, ec2_url, aws_connect_params):
+    """Returns a hashable key identifying the region, endpoint and credentials of a connection"""
+    return (region, ec2_url, tuple(sorted(aws_connect_params.items())))
+
+
+def get_connection(module, conn_key):
+    if conn_key not in _CONNECTIONS:
+        # the pool is sized for the update calls run concurrently by run_calls
+        config = Config(max_pool_connections=MAX_CONCURRENT_CALLS, retries=dict(max_attempts=5))
+        _CONNECTIONS[conn_key] = module.client('ec2', config=config)
+    return _CONNECTIONS[conn_key]
+
+
+def vpc_exists(module, vpc, names, cidr_block, multi, conn_key, skip_deleted=False):
+    """Returns a dict of each name to None or a vpc object depending on the existence
+    of a VPC. When supplied with a CIDR, it will check for matching tags to determine
+    if it is a match otherwise it will assume the VPC does not exist and thus map the
+    name to None. With skip_deleted, VPCs this process deleted aren't looked up again.
+    """
+    matched_vpcs = dict((name, None) for name in names)
 
     if multi:
-        return None
-    elif len(matching_vpcs) == 1:
-        matched_vpc = matching_vpcs[0]
-    elif len(matching_vpcs) > 1:
-        module.fail_json(msg='Currently there are %d VPCs that have the same name and '
-                             'CIDR block you specified. If you would like to create '
-                             'the VPC anyway please pass True to the multi_ok param.' % len(matching_vpcs))
+        return matched_vpcs
 
-    return matched_vpc
+    if skip_deleted:
+        names = [name for name in names if (conn_key, name, cidr_block) not in _DELETED_VPCS]
+        if not names:
+            return matched_vpcs
 
+    for name, matching_vpcs in _describe_vpcs_cached(module, vpc, conn_key, names, cidr_block).items():
+        vpc_count = len(matching_vpcs)
 
-def update_vpc_tags(vpc, module, vpc_obj, tags, name):
+        if vpc_count == 1:
+            matched_vpcs[name] = matching_vpcs[0]
+        elif vpc_count > 1:
+            module.fail_json(msg='Currently there are {0} VPCs that have the name {1} and the '
+                                 'CIDR block you specified. If you would like to create '
+                                 'the VPC anyway please pass True to the multi_ok param.'.format(vpc_count, name))
 
-    if tags is None:
-        tags = dict()
+    return matched_vpcs
 
-    tags.update({'Name': name})
+
+def group_names_by_vpc(vpcs, names):
+    """Returns (VPC id, names) pairs, in the order of names, for the VPCs the names
+    were matched to. Names with wildcards can match the same VPC as another name.
+    """
+    grouped = []
+    vpc_names = dict()
+    for name in names:
+        if vpcs[name] is not None:
+            vpc_id = vpcs[name]['VpcId']
+            if vpc_id not in vpc_names:
+                vpc_names[vpc_id] = []
+                grouped.append((vpc_id, vpc_names[vpc_id]))
+            vpc_names[vpc_id].append(name)
+    return grouped
+
+
+def create_vpcs(connection, module, names, cidr_block, tenancy):
+    vpcs = []
+    for name in names:
+        with aws_errors(module, "Failed to create VPC"):
+            vpcs.append(connection.create_vpc(CidrBlock=cidr_block, InstanceTenancy=tenancy)['Vpc'])
+
+    # A new VPC may not be visible to the other calls straight away, and is only
+    # found again by its Name tag, so tag it as soon as it exists. That way a
+    # failure waiting for it below doesn't leave a VPC the next run can't find.
+    vpc_ids = [vpc_obj['VpcId'] for vpc_obj in vpcs]
+    with aws_errors(module, "Failed to wait for VPCs {0} to exist".format(', '.join(vpc_ids))):
+        connection.get_waiter('vpc_exists').wait(VpcIds=vpc_ids, WaiterConfig=dict(Delay=1, MaxAttempts=30))
+    run_calls(module, [("Failed to tag VPC {0}".format(vpc_obj['VpcId']), connection.create_tags,
+                        dict(Resources=[vpc_obj['VpcId']], Tags=[{'Key': 'Name', 'Value': name}]))
+                       for name, vpc_obj in zip(names, vpcs)])
+    for name, vpc_obj in zip(names, vpcs):
+        vpc_obj['Tags'] = [{'Key': 'Name', 'Value': name}]
+
+    # A new VPC starts out pending; wait for them all at once so the result isn't
+    # stale and the follow-up calls don't act on a VPC that isn't ready yet
+    with aws_errors(module, "Failed to wait for VPCs {0} to become available".format(', '.join(vpc_ids))):
+        connection.get_waiter('vpc_available').wait(VpcIds=vpc_ids, WaiterConfig=dict(Delay=5, MaxAttempts=12))
+    for vpc_obj in vpcs:
+        vpc_obj['State'] = 'available'
+
+    return vpcs
+
+
+def get_classic_link_status(connection, vpc_ids):
+    """Returns a dict of each VPC id to whether ClassicLink is enabled for it. describe_vpcs
+    doesn't return this, so it takes a call of its own.
+    """
     try:
-        current_tags = dict((t.name, t.value) for t in vpc.get_all_tags(filters={'resource-id': vpc_obj.id}))
-        if tags != current_tags:
-            if not module.check_mode:
-                vpc.create_tags(vpc_obj.id, tags)
-            return True
-        else:
-            return False
-    except Exception as e:
-        e_msg = boto_exception(e)
-        module.fail_json(msg=e_msg)
+        results = connection.describe_vpc_classic_link(VpcIds=vpc_ids)
+    except botocore.exceptions.ClientError as e:
+        # regions without EC2-Classic don't support ClassicLink at all
+        if e.response['Error']['Code'] == 'UnsupportedOperation':
+            return dict((vpc_id, False) for vpc_id in vpc_ids)
+        # don't require ec2:DescribeVpcClassicLink just to report the status
+        if e.response['Error']['Code'] == 'UnauthorizedOperation':
+            return dict((vpc_id, None) for vpc_id in vpc_ids)
+        raise
+    return dict((vpc['VpcId'], vpc.get('ClassicLinkEnabled')) for vpc in results['Vpcs'])
+
+
+def update_vpc_tags(connection, module, vpc_obj, tags, name, calls):
+
+    # copy rather than update the tags param in place
+    tags = dict(tags or {})
+    tags['Name'] = name
+
+    # describe_vpcs already returned the current tags, and tags not in the desired
+    # set are left alone, so only the tags that differ need to be sent
+    current_tags = boto3_tag_list_to_ansible_dict(vpc_obj.get('Tags', []))
+    to_add, to_delete = compare_aws_tags(current_tags, tags, purge_tags=False)
+    if to_add:
+        if not module.check_mode:
+            calls.append(("Failed to update tags on VPC {0}".format(vpc_obj['VpcId']), connection.create_tags,
+                          dict(Resources=[vpc_obj['VpcId']], Tags=ansible_dict_to_boto3_tag_list(to_add))))
+            current_tags.update(to_add)
+            vpc_obj['Tags'] = ansible_dict_to_boto3_tag_list(current_tags)
+        return True
+    else:
+        return False
+
+
+def update_dhcp_opts(connection, module, vpc_obj, dhcp_id, calls):
+
+    if vpc_obj.get('DhcpOptionsId') != dhcp_id:
+        if not module.check_mode:
+            calls.append(("Failed to associate DHCP options {0} with VPC {1}".format(dhcp_id, vpc_obj['VpcId']),
+                          connection.associate_dhcp_options, dict(DhcpOptionsId=dhcp_id, VpcId=vpc_obj['VpcId'])))
+            vpc_obj['DhcpOptionsId'] = dhcp_id
+        return True
+    else:
+        return False
+
+
+def set_dns_attributes(connection, vpc_id, dns_support=None, dns_hostnames=None):
+    """Sets the DNS attributes of a VPC, leaving those passed as None alone. The EC2
+    API only accepts a single attribute per modify_vpc_attribute call, and DNS
+    hostnames can only be enabled while DNS support is enabled, so the calls are
+    ordered accordingly.
+    """
+    if dns_support:
+        connection.modify_vpc_attribute(VpcId=vpc_id, EnableDnsSupport={'Value': dns_support})
+    if dns_hostnames is not None:
+        connection.modify_vpc_attribute(VpcId=vpc_id, EnableDnsHostnames={'Value': dns_hostnames})
+    if dns_support is False:
+        connection.modify_vpc_attribute(VpcId=vpc_id, EnableDnsSupport={'Value': dns_support})
+
+
+def get_dns_attribute(connection, vpc_id, attribute):
+    """Returns the current value of a DNS attribute of a VPC. The EC2 API only
+    describes a single attribute per describe_vpc_attribute call.
+    """
+    return connection.describe_vpc_attribute(VpcId=vpc_id, Attribute=attribute)[attribute[0].upper() + attribute[1:]]['Value']
+
+
+def update_dns_attributes(connection, module, vpc_id, current_dns, dns_support, dns_hostnames, calls):
 
+    current_dns_support, current_dns_hostnames = current_dns
 
-def update_dhcp_opts(connection, module, vpc_obj, dhcp_id):
+    to_set = dict()
+    if current_dns_support != dns_support:
+        to_set['dns_support'] = dns_support
+    if current_dns_hostnames != dns_hostnames:
+        to_set['dns_hostnames'] = dns_hostnames
 
-    if vpc_obj.dhcp_options_id != dhcp_id:
+    if to_set:
         if not module.check_mode:
-            connection.associate_dhcp_options(dhcp_id, vpc_obj.id)
+            calls.append(("Failed to update DNS attributes on VPC {0}".format(vpc_id), set_dns_attributes,
+                          dict(connection=connection, vpc_id=vpc_id, **to_set)))
         return True
     else:
         return False
 
 
+def run_calls(module, calls):
+    """Runs independent (error message, function, kwargs) AWS calls concurrently so
+    they cost a single round-trip between them, and returns their results in order.
+    The workers only raise exceptions; the module is failed from the main thread.
+    """
+    if not calls:
+        return []
+
+    if len(calls) == 1:
+        # nothing to overlap with, so skip the thread pool
+        msg, func, kwargs = calls[0]
+        with aws_errors(module, msg):
+            return [func(**kwargs)]
+
+    # multiprocessing is slow to import and is only needed once there are calls to make
+    from multiprocessing.pool import ThreadPool
+
+    pool = ThreadPool(min(len(calls), MAX_CONCURRENT_CALLS))
+    try:
+        results = [(msg, pool.apply_async(func, kwds=kwargs)) for msg, func, kwargs in calls]
+        values = []
+        for msg, result in results:
+            with aws_errors(module, msg):
+                values.append(result.get())
+        return values
+    finally:
+        pool.close()
+        pool.join()
+
+
 def get_vpc_values(vpc_obj):
 
     if vpc_obj is not None:
-        vpc_values = vpc_obj.__dict__
-        if "region" in vpc_values:
-            vpc_values.pop("region")
-        if "item" in vpc_values:
-            vpc_values.pop("item")
-        if "connection" in vpc_values:
-            vpc_values.pop("connection")
+        vpc_values = dict((key, vpc_obj.get(boto3_key)) for key, boto3_key in VPC_RETURN_KEYS)
+        vpc_values['tags'] = boto3_tag_list_to_ansible_dict(vpc_obj.get('Tags', []))
         return vpc_values
     else:
         return None
 
 
-def main():
-    argument_spec = ec2_argument_spec()
-    argument_spec.update(dict(
-        name=dict(type='str', default=None, required=True),
-        cidr_block=dict(type='str', default=None, required=True),
-        tenancy=dict(choices=['default', 'dedicated'], default='default'),
-        dns_support=dict(type='bool', default=True),
-        dns_hostnames=dict(type='bool', default=True),
-        dhcp_opts_id=dict(type='str', default=None, required=False),
-        tags=dict(type='dict', required=False, default=None, aliases=['resource_tags']),
-        state=dict(choices=['present', 'absent'], default='present'),
-        multi_ok=dict(type='bool', default=False)
-    )
-    )
+def _validate_params(module, region, names):
+    """Runs every check that doesn't need AWS, so bad input fails before a connection is made"""
+    if not region:
+        module.fail_json(msg="region must be specified")
+
+    if not names:
+        module.fail_json(msg="name must be a VPC name or a non-empty list of VPC names")
+
+    if len(names) > MAX_VPC_NAMES:
+        module.fail_json(msg="name must not contain more than {0} VPC names".format(MAX_VPC_NAMES))
+
+    for name in names:
+        if not isinstance(name, string_types) or not name:
+            module.fail_json(msg="Every VPC name must be a non-empty string, got {0!r}".format(name))
+
+    if len(set(names)) != len(names):
+        module.fail_json(msg="name must not contain the same VPC name more than once")
 
-    module = AnsibleModule(
-        argument_spec=argument_spec,
+    if module.params.get('dns_hostnames') and not module.params.get('dns_support'):
+        module.fail_json(msg='In order to enable DNS Hostnames you must also enable DNS support')
+
+
+def main():
+    module = AnsibleAWSModule(
+        argument_spec=_ARGUMENT_SPEC_EXTRAS,
         supports_check_mode=True
     )
 
-    if not HAS_BOTO:
-        module.fail_json(msg='boto is required for this module')
-
     name = module.params.get('name')
     cidr_block = module.params.get('cidr_block')
     tenancy = module.params.get('tenancy')
@@ -248,88 +555,103 @@ def main():
     state = module.params.get('state')
     multi = module.params.get('multi_ok')
 
+    # A list of names manages one VPC per name, sharing the lookups, the client
+    # and the concurrent update calls between them
+    if isinstance(name, list):
+        names = name
+    else:
+        # a single name is converted the way type='str' did before lists were accepted
+        names = [to_native(name)]
+
     changed = False
 
-    region, ec2_url, aws_connect_params = get_aws_connection_info(module)
+    region, ec2_url, aws_connect_params = get_aws_connection_info(module, boto3=True)
 
-    if region:
-        try:
-            connection = connect_to_aws(boto.vpc, region, **aws_connect_params)
-        except (NoAuthHandlerFound, AnsibleAWSError) as e:
-            module.fail_json(msg=str(e))
-    else:
-        module.fail_json(msg="region must be specified")
+    _validate_params(module, region, names)
+    names = [to_native(n) for n in names]
 
-    if dns_hostnames and not dns_support:
-        module.fail_json(msg='In order to enable DNS Hostnames you must also enable DNS support')
+    conn_key = connection_key(region, ec2_url, aws_connect_params)
+    connection = get_connection(module, conn_key)
+
+    # Check if the VPCs exist
+    vpcs = vpc_exists(module, connection, names, cidr_block, multi, conn_key, skip_deleted=(state == 'absent'))
 
     if state == 'present':
 
-        # Check if VPC exists
-        vpc_obj = vpc_exists(module, connection, name, cidr_block, multi)
+        # The lookup above is current, so don't trust older deletions of these names
+        _DELETED_VPCS.difference_update((conn_key, n, cidr_block) for n in names)
 
-        if vpc_obj is None:
-            try:
-                changed = True
-                if not module.check_mode:
-                    vpc_obj = connection.create_vpc(cidr_block, instance_tenancy=tenancy)
-                else:
-                    module.exit_json(changed=changed)
-            except BotoServerError as e:
-                module.fail_json(msg=e)
-
-        if dhcp_id is not None:
-            try:
-                if update_dhcp_opts(connection, module, vpc_obj, dhcp_id):
-                    changed = True
-            except BotoServerError as e:
-                module.fail_json(msg=e)
-
-        if tags is not None or name is not None:
-            try:
-                if update_vpc_tags(connection, module, vpc_obj, tags, name):
-                    changed = True
-            except BotoServerError as e:
-                module.fail_json(msg=e)
+        # A VPC can only be given one of the names that match it
+        for vpc_id, vpc_names in group_names_by_vpc(vpcs, names):
+            if len(vpc_names) > 1:
+                module.fail_json(msg="The names {0} and {1} both match VPC {2}. Each name must match a "
+                                     "different VPC.".format(vpc_names[0], vpc_names[1], vpc_id))
 
-        # Note: Boto currently doesn't currently provide an interface to ec2-describe-vpc-attribute
-        # which is needed in order to detect the current status of DNS options. For now we just update
-        # the attribute each time and is not used as a changed-factor.
-        try:
+        missing = [n for n in names if vpcs[n] is None]
+        if missing:
+            changed = True
             if not module.check_mode:
-                connection.modify_vpc_attribute(vpc_obj.id, enable_dns_support=dns_support)
-                connection.modify_vpc_attribute(vpc_obj.id, enable_dns_hostnames=dns_hostnames)
-        except BotoServerError as e:
-            e_msg = boto_exception(e)
-            module.fail_json(msg=e_msg)
+                vpcs.update(zip(missing, create_vpcs(connection, module, missing, cidr_block, tenancy)))
+
+        # In check mode VPCs that would be created have nothing to update
+        present = [n for n in names if vpcs[n] is not None]
+
+        # Both DNS attributes of every VPC and their ClassicLink status are read concurrently
+        vpc_ids = [vpcs[n]['VpcId'] for n in present]
+        reads = [("Failed to describe DNS attributes of VPC {0}".format(vpc_id), get_dns_attribute,
+                  dict(connection=connection, vpc_id=vpc_id, attribute=attribute))
+                 for vpc_id in vpc_ids for attribute in ('enableDnsSupport', 'enableDnsHostnames')]
+        if vpc_ids:
+            # an empty VpcIds would describe every VPC in the region
+            reads.append(("Failed to describe ClassicLink status of VPCs {0}".format(', '.join(vpc_ids)), get_classic_link_status,
+                          dict(connection=connection, vpc_ids=vpc_ids)))
+        read_values = run_calls(module, reads)
+        dns_values = read_values[:2 * len(vpc_ids)]
+        current_dns = zip(dns_values[0::2], dns_values[1::2])
+        classic_link = read_values[-1] if vpc_ids else dict()
+
+        # The DHCP options, tags and DNS attributes are independent of each other,
+        # so the calls needed to update them are collected and run concurrently.
+        calls = []
+
+        for vpc_name, vpc_dns in zip(present, current_dns):
+            vpc_obj = vpcs[vpc_name]
+
+            if dhcp_id is not None:
+                if update_dhcp_opts(connection, module, vpc_obj, dhcp_id, calls):
+                    changed = True
 
-        if not module.check_mode:
-            # get the vpc obj again in case it has changed
-            try:
-                vpc_obj = connection.get_all_vpcs(vpc_obj.id)[0]
-            except BotoServerError as e:
-                e_msg = boto_exception(e)
-                module.fail_json(msg=e_msg)
+            if update_vpc_tags(connection, module, vpc_obj, tags, vpc_name, calls):
+                changed = True
 
-        module.exit_json(changed=changed, vpc=get_vpc_values(vpc_obj))
+            if update_dns_attributes(connection, module, vpc_obj['VpcId'], vpc_dns, dns_support, dns_hostnames, calls):
+                changed = True
 
-    elif state == 'absent':
+        # The update functions have applied their changes to the vpc objects, so
+        # they don't need to be described again afterwards
+        run_calls(module, calls)
 
-        # Check if VPC exists
-        vpc_obj = vpc_exists(module, connection, name, cidr_block, multi)
+        for vpc_name in present:
+            vpcs[vpc_name]['ClassicLinkEnabled'] = classic_link.get(vpcs[vpc_name]['VpcId'])
 
-        if vpc_obj is not None:
-            try:
-                if not module.check_mode:
-                    connection.delete_vpc(vpc_obj.id)
-                vpc_obj = None
-                changed = True
-            except BotoServerError as e:
-                e_msg = boto_exception(e)
-                module.fail_json(msg="%s. You may want to use the ec2_vpc_subnet, ec2_vpc_igw, "
-                                 "and/or ec2_vpc_route_table modules to ensure the other components are absent." % e_msg)
+    elif state == 'absent':
 
-        module.exit_json(changed=changed, vpc=get_vpc_values(vpc_obj))
+        found = [n for n in names if vpcs[n] is not None]
+        if found:
+            if not module.check_mode:
+                # names with wildcards can match the same VPC, delete it only once
+                vpc_ids = [vpc_id for vpc_id, vpc_names in group_names_by_vpc(vpcs, found)]
+                run_calls(module, [("Failed to delete VPC {0}. You may want to use the ec2_vpc_subnet, ec2_vpc_igw, "
+                                    "and/or ec2_vpc_route_table modules to ensure the other components are absent.".format(vpc_id),
+                                    connection.delete_vpc, dict(VpcId=vpc_id)) for vpc_id in vpc_ids])
+                _DELETED_VPCS.update((conn_key, n, cidr_block) for n in found)
+            vpcs = dict((n, None) for n in names)
+            changed = True
+
+    if isinstance(name, list):
+        module.exit_json(changed=changed, vpcs=[get_vpc_values(vpcs[n]) for n in names])
+    else:
+        module.exit_json(changed=changed, vpc=get_vpc_values(vpcs[names[0]]))
 
 
 if __name__ == '__main__':
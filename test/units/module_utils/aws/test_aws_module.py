@@ -54,6 +54,21 @@ class AWSModuleTestCase(unittest.TestCase):
         assert 'success' in m_no_defs_params["success_string_arg"]
         assert 'aws_secret_key' not in m_no_defs_params
 
+    def test_client_should_use_module_connection_arguments(self):
+        module_args = to_bytes(json.dumps({'ANSIBLE_MODULE_ARGS': {'region': 'us-west-2'}}))
+        with patch.object(basic, '_ANSIBLE_ARGS', module_args):
+            m = AnsibleAWSModule(argument_spec=dict())
+
+            with patch('ansible.module_utils.aws.core.boto3_conn') as boto3_conn_double:
+                m.client('ec2', config='fake config')
+
+        assert len(boto3_conn_double.mock_calls) == 1, "should connect exactly once"
+        kwargs = boto3_conn_double.mock_calls[0][2]
+        assert kwargs['conn_type'] == 'client'
+        assert kwargs['resource'] == 'ec2'
+        assert kwargs['region'] == 'us-west-2'
+        assert kwargs['config'] == 'fake config'
+
 
 class ErrorReportingTestcase(unittest.TestCase):
 
@@ -0,0 +1,151 @@
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+botocore = pytest.importorskip("botocore")
+
+from ansible.modules.cloud.amazon import ec2_vpc_net
+
+CONN_KEY = ('us-east-1', None, ())
+CIDR = '10.0.0.0/16'
+
+
+class FakeModule(object):
+    def fail_json(self, *args, **kwargs):
+        raise Exception(kwargs.get('msg'))
+
+    fail_json_aws = fail_json
+
+
+class FakeConnection(object):
+    """Returns the VPCs the EC2 API would for a tag:Name and cidr-block or a vpc-id filter"""
+    def __init__(self, vpcs):
+        self.vpcs = vpcs
+        self.calls = []
+
+    def describe_vpcs(self, Filters):
+        filters = dict((f['Name'], f['Values']) for f in Filters)
+        self.calls.append(filters)
+        if 'vpc-id' in filters:
+            return {'Vpcs': [dict(vpc) for vpc in self.vpcs if vpc['VpcId'] in filters['vpc-id']]}
+        # the server does the wildcard matching, so reuse the pattern being tested
+        return {'Vpcs': [dict(vpc) for vpc in self.vpcs if vpc['CidrBlock'] in filters['cidr-block'] and
+                         any(ec2_vpc_net._filter_value_regex(name).match(vpc_name(vpc)) for name in filters['tag:Name'])]}
+
+
+def make_vpc(vpc_id, name, cidr_block=CIDR):
+    return {'VpcId': vpc_id, 'CidrBlock': cidr_block, 'Tags': [{'Key': 'Name', 'Value': name}]}
+
+
+def vpc_name(vpc):
+    return dict((tag['Key'], tag['Value']) for tag in vpc['Tags'])['Name']
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    ec2_vpc_net._VPC_CACHE.clear()
+    yield
+    ec2_vpc_net._VPC_CACHE.clear()
+
+
+@pytest.mark.parametrize("value, name, matches", [
+    ('web1', 'web1', True),
+    ('web', 'web1', False),
+    ('web1', 'web', False),
+    ('web*', 'web', True),
+    ('web*', 'web-prod-1', True),
+    ('*', '', True),
+    ('web?', 'web1', True),
+    ('web?', 'web', False),
+    ('web?', 'web12', False),
+    ('web\\*', 'web*', True),
+    ('web\\*', 'web1', False),
+    ('web\\?', 'web1', False),
+    ('web\\\\', 'web\\', True),
+    ('web\\', 'web\\', True),
+    ('a.c', 'abc', False),
+    ('a.c', 'a.c', True),
+    ('a+[b]', 'a+[b]', True),
+    ('a+[b]', 'aab', False),
+    ('(web)|db', 'db', False),
+    ('Web*', 'web1', False),
+    ('web*', 'WEB1', False),
+    ('web*', 'web\nprod', True),
+])
+def test_filter_value_regex(value, name, matches):
+    assert bool(ec2_vpc_net._filter_value_regex(value).match(name)) is matches
+
+
+def test_describe_vpcs_files_vpcs_under_every_matching_name():
+    connection = FakeConnection([make_vpc('vpc-1', 'web1'), make_vpc('vpc-2', 'web2'), make_vpc('vpc-3', 'db')])
+    matched = ec2_vpc_net._describe_vpcs_cached(FakeModule(), connection, CONN_KEY, ['web*', 'web1', 'db', 'other'], CIDR)
+
+    assert len(connection.calls) == 1
+    assert [vpc['VpcId'] for vpc in matched['web*']] == ['vpc-1', 'vpc-2']
+    assert [vpc['VpcId'] for vpc in matched['web1']] == ['vpc-1']
+    assert [vpc['VpcId'] for vpc in matched['db']] == ['vpc-3']
+    assert matched['other'] == []
+
+
+def test_describe_vpcs_ignores_vpcs_matching_no_name():
+    # a VPC the server returned but that none of the names match
+    connection = FakeConnection([make_vpc('vpc-1', 'web1')])
+    connection.describe_vpcs = lambda Filters: {'Vpcs': [make_vpc('vpc-1', 'web1'), make_vpc('vpc-9', 'unrelated')]}
+    matched = ec2_vpc_net._describe_vpcs_cached(FakeModule(), connection, CONN_KEY, ['web?'], CIDR)
+
+    assert [vpc['VpcId'] for vpc in matched['web?']] == ['vpc-1']
+
+
+def test_describe_vpcs_caches_only_single_matches():
+    connection = FakeConnection([make_vpc('vpc-1', 'web1'), make_vpc('vpc-2', 'web2')])
+    ec2_vpc_net._describe_vpcs_cached(FakeModule(), connection, CONN_KEY, ['web1', 'web*', 'db'], CIDR)
+
+    assert ec2_vpc_net._VPC_CACHE == {(CONN_KEY, 'web1', CIDR): 'vpc-1'}
+
+
+def test_describe_vpcs_reads_cached_vpcs_again():
+    connection = FakeConnection([make_vpc('vpc-1', 'web1')])
+    ec2_vpc_net._describe_vpcs_cached(FakeModule(), connection, CONN_KEY, ['web1'], CIDR)
+    connection.vpcs[0]['DhcpOptionsId'] = 'dopt-2'
+    matched = ec2_vpc_net._describe_vpcs_cached(FakeModule(), connection, CONN_KEY, ['web1'], CIDR)
+
+    assert connection.calls[1] == {'vpc-id': ['vpc-1']}
+    assert len(connection.calls) == 2
+    assert matched['web1'][0]['DhcpOptionsId'] == 'dopt-2'
+
+
+def test_describe_vpcs_looks_up_again_when_cached_vpc_no_longer_matches():
+    connection = FakeConnection([make_vpc('vpc-1', 'web1')])
+    ec2_vpc_net._describe_vpcs_cached(FakeModule(), connection, CONN_KEY, ['web1'], CIDR)
+    connection.vpcs[:] = [make_vpc('vpc-1', 'renamed'), make_vpc('vpc-2', 'web1')]
+    matched = ec2_vpc_net._describe_vpcs_cached(FakeModule(), connection, CONN_KEY, ['web1'], CIDR)
+
+    assert len(connection.calls) == 3
+    assert [vpc['VpcId'] for vpc in matched['web1']] == ['vpc-2']
+    assert ec2_vpc_net._VPC_CACHE == {(CONN_KEY, 'web1', CIDR): 'vpc-2'}
+
+
+def test_describe_vpcs_looks_up_again_after_nothing_was_found():
+    connection = FakeConnection([])
+    ec2_vpc_net._describe_vpcs_cached(FakeModule(), connection, CONN_KEY, ['web1'], CIDR)
+    connection.vpcs.append(make_vpc('vpc-1', 'web1'))
+    matched = ec2_vpc_net._describe_vpcs_cached(FakeModule(), connection, CONN_KEY, ['web1'], CIDR)
+
+    assert [vpc['VpcId'] for vpc in matched['web1']] == ['vpc-1']
+
+
+def test_describe_vpcs_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(ec2_vpc_net, 'VPC_CACHE_SIZE', 2)
+    connection = FakeConnection([make_vpc('vpc-%d' % i, 'web%d' % i) for i in range(3)])
+    for i in range(3):
+        ec2_vpc_net._describe_vpcs_cached(FakeModule(), connection, CONN_KEY, ['web%d' % i], CIDR)
+
+    assert len(ec2_vpc_net._VPC_CACHE) <= 2
+    assert ec2_vpc_net._VPC_CACHE[(CONN_KEY, 'web2', CIDR)] == 'vpc-2'
+
+
+def test_group_names_by_vpc():
+    vpc_1 = make_vpc('vpc-1', 'web1')
+    vpcs = {'web*': vpc_1, 'db': make_vpc('vpc-2', 'db'), 'web1': vpc_1, 'other': None}
+
+    assert ec2_vpc_net.group_names_by_vpc(vpcs, ['web*', 'other', 'db', 'web1']) == [('vpc-1', ['web*', 'web1']), ('vpc-2', ['db'])]
+    assert ec2_vpc_net.group_names_by_vpc(vpcs, ['other']) == []